@@ -27,9 +27,26 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--eval-end", default=settings.eval_end, help="Evaluation end date")
     parser.add_argument("--exchange", default=settings.exchange_id, help="ccxt exchange id")
     parser.add_argument("--limit", type=int, default=settings.limit, help="ccxt page size")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.fetch_concurrency,
+        help="Concurrent ccxt page requests",
+    )
     parser.add_argument(
         "--pivot-window", type=int, default=settings.pivot_window, help="Trailing pivot window"
     )
+    parser.add_argument(
+        "--fast-io",
+        action="store_true",
+        default=settings.fast_io,
+        help="Parse CSV input with pyarrow",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=settings.cache_dir,
+        help="Optional directory for cached prepared datasets (CSV input only)",
+    )
     parser.add_argument("--fee-rate", type=float, default=settings.fee_rate, help="One-way fee rate")
     parser.add_argument("--trades-csv", default=None, help="Optional output path for trade list")
     return parser.parse_args()
@@ -47,8 +64,11 @@ def main() -> int:
         eval_end=args.eval_end,
         exchange_id=args.exchange,
         limit=args.limit,
+        fetch_concurrency=args.concurrency,
         pivot_window=args.pivot_window,
         fee_rate=args.fee_rate,
+        fast_io=args.fast_io,
+        cache_dir=args.cache_dir,
     )
     if args.trades_csv:
         Path(args.trades_csv).parent.mkdir(parents=True, exist_ok=True)
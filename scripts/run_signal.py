@@ -11,7 +11,7 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
-from cryptoinvest.backtest import fetch_ohlcv_ccxt, load_ohlcv_csv, prepare_dataset
+from cryptoinvest.backtest import fetch_ohlcv_ccxt, load_prepared_csv, prepare_dataset
 from cryptoinvest.config import load_settings
 from cryptoinvest.signals import build_latest_signal
 
@@ -26,16 +26,38 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--end", default=settings.end, help="Fetch end ISO datetime")
     parser.add_argument("--exchange", default=settings.exchange_id, help="ccxt exchange id")
     parser.add_argument("--limit", type=int, default=settings.limit, help="ccxt page size")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.fetch_concurrency,
+        help="Concurrent ccxt page requests",
+    )
     parser.add_argument(
         "--pivot-window", type=int, default=settings.pivot_window, help="Trailing pivot window"
     )
+    parser.add_argument(
+        "--fast-io",
+        action="store_true",
+        default=settings.fast_io,
+        help="Parse CSV input with pyarrow",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=settings.cache_dir,
+        help="Optional directory for cached prepared datasets (CSV input only)",
+    )
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
     if args.csv:
-        raw = load_ohlcv_csv(args.csv)
+        frame = load_prepared_csv(
+            args.csv,
+            pivot_window=args.pivot_window,
+            cache_dir=args.cache_dir,
+            fast_io=args.fast_io,
+        )
     else:
         raw = fetch_ohlcv_ccxt(
             symbol=args.symbol,
@@ -44,9 +66,10 @@ def main() -> int:
             end=args.end,
             exchange_id=args.exchange,
             limit=args.limit,
+            concurrency=args.concurrency,
         )
+        frame = prepare_dataset(raw, pivot_window=args.pivot_window)
 
-    frame = prepare_dataset(raw, pivot_window=args.pivot_window)
     signal = build_latest_signal(frame)
     payload = {"timestamp": frame.index[-1].isoformat(), **signal}
     print(json.dumps(payload, indent=2, sort_keys=True))
@@ -1,8 +1,32 @@
 """cryptoinvest package."""
 
-from .backtest import run_backtest
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .config import Settings, load_settings
-from .signals import build_latest_signal
 
-__all__ = ["Settings", "build_latest_signal", "load_settings", "run_backtest"]
+if TYPE_CHECKING:
+    from .backtest import run_backtest, run_backtest_sweep
+    from .signals import build_latest_signal
+
+__all__ = ["Settings", "build_latest_signal", "load_settings", "run_backtest", "run_backtest_sweep"]
 __version__ = "0.1.0"
+
+# Exports that pull in pandas/numba are imported on first access, so importing
+# ``cryptoinvest.config`` alone stays cheap.
+_LAZY_EXPORTS = {
+    "build_latest_signal": ".signals",
+    "run_backtest": ".backtest",
+    "run_backtest_sweep": ".backtest",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,218 @@
+"""Compiled pending-order trade simulator used by ``backtest.simulate_trades``.
+
+Sides are encoded as ``SIDE_LONG``/``SIDE_SHORT`` (0 means no signal) and exit
+reasons as indices into ``EXIT_REASONS`` so the kernel only touches numbers.
+"""
+
+from __future__ import annotations
+
+from ._njit import njit, prange
+
+SIDE_NONE = 0
+SIDE_LONG = 1
+SIDE_SHORT = 2
+
+EXIT_REASONS = ("stop_loss", "target", "stop_and_target_same_candle", "end_of_data")
+_REASON_STOP = 0
+_REASON_TARGET = 1
+_REASON_BOTH = 2
+_REASON_END = 3
+# Indexed by ``hit_stop * 2 + hit_target``; code 0 keeps the trade open.
+_EXIT_CODE_REASON = (-1, _REASON_TARGET, _REASON_STOP, _REASON_BOTH)
+
+
+@njit(cache=True, inline="always")
+def _is_valid_order(side, entry, stop, target):
+    if side == SIDE_LONG:
+        return stop < entry < target
+    if side == SIDE_SHORT:
+        return target < entry < stop
+    return False
+
+
+# Round-trip fees are approximated as linear in notional.
+@njit(cache=True, inline="always")
+def _pnl_long(entry, exit_price, fee_rate):
+    return (exit_price - entry) / entry - 2 * fee_rate
+
+
+@njit(cache=True, inline="always")
+def _pnl_short(entry, exit_price, fee_rate):
+    return (entry - exit_price) / entry - 2 * fee_rate
+
+
+@njit(cache=True, inline="always")
+def _trade_pnl(side, entry, exit_price, fee_rate):
+    if side == SIDE_LONG:
+        return _pnl_long(entry, exit_price, fee_rate)
+    return _pnl_short(entry, exit_price, fee_rate)
+
+
+@njit(cache=True)
+def _simulate_njit(
+    high,
+    low,
+    close,
+    action,
+    entry,
+    stop,
+    target,
+    fee_rate,
+    out_sig,
+    out_ent,
+    out_exit,
+    out_side,
+    out_entry_px,
+    out_sl,
+    out_tgt,
+    out_exit_px,
+    out_pnl,
+    out_reason,
+):
+    """Run the pending-order state machine and return the number of trades.
+
+    Trade bars (signal/entry/exit) are written as row positions; output buffers
+    must hold at least ``len(high)`` trades. Inputs may be plain lists when
+    running interpreted without numba.
+    """
+    n = len(high)
+    count = 0
+
+    has_pending = False
+    pending_sig = 0
+    pending_side = SIDE_NONE
+    pending_entry = 0.0
+    pending_stop = 0.0
+    pending_target = 0.0
+
+    has_open = False
+    open_sig = 0
+    open_bar = 0
+    open_side = SIDE_NONE
+    open_entry = 0.0
+    open_stop = 0.0
+    open_target = 0.0
+
+    for i in range(n):
+        if not has_open and has_pending:
+            has_open = True
+            open_sig = pending_sig
+            open_bar = i
+            open_side = pending_side
+            open_entry = pending_entry
+            open_stop = pending_stop
+            open_target = pending_target
+            has_pending = False
+
+        if has_open:
+            if open_side == SIDE_LONG:
+                hit_stop = low[i] <= open_stop
+                hit_target = high[i] >= open_target
+            else:
+                hit_stop = high[i] >= open_stop
+                hit_target = low[i] <= open_target
+
+            exit_code = int(hit_stop) * 2 + int(hit_target)
+            if exit_code:
+                # A stop hit wins ties with the target on the same candle.
+                exit_price = open_stop if hit_stop else open_target
+                reason = _EXIT_CODE_REASON[exit_code]
+                out_sig[count] = open_sig
+                out_ent[count] = open_bar
+                out_exit[count] = i
+                out_side[count] = open_side
+                out_entry_px[count] = open_entry
+                out_sl[count] = open_stop
+                out_tgt[count] = open_target
+                out_exit_px[count] = exit_price
+                out_pnl[count] = _trade_pnl(open_side, open_entry, exit_price, fee_rate)
+                out_reason[count] = reason
+                count += 1
+                has_open = False
+
+        if not has_open and not has_pending:
+            side = action[i]
+            entry_i = entry[i]
+            stop_i = stop[i]
+            target_i = target[i]
+            if (
+                side != SIDE_NONE
+                and entry_i == entry_i
+                and stop_i == stop_i
+                and target_i == target_i
+                and _is_valid_order(side, entry_i, stop_i, target_i)
+            ):
+                has_pending = True
+                pending_sig = i
+                pending_side = side
+                pending_entry = entry_i
+                pending_stop = stop_i
+                pending_target = target_i
+
+    if has_open:
+        final_close = close[n - 1]
+        out_sig[count] = open_sig
+        out_ent[count] = open_bar
+        out_exit[count] = n - 1
+        out_side[count] = open_side
+        out_entry_px[count] = open_entry
+        out_sl[count] = open_stop
+        out_tgt[count] = open_target
+        out_exit_px[count] = final_close
+        out_pnl[count] = _trade_pnl(open_side, open_entry, final_close, fee_rate)
+        out_reason[count] = _REASON_END
+        count += 1
+
+    return count
+
+
+@njit(cache=True, parallel=True)
+def _sweep_njit(
+    high,
+    low,
+    close,
+    action_table,
+    entry_table,
+    stop_table,
+    target_table,
+    table_row,
+    fee_rates,
+    out_sig,
+    out_ent,
+    out_exit,
+    out_side,
+    out_entry_px,
+    out_sl,
+    out_tgt,
+    out_exit_px,
+    out_pnl,
+    out_reason,
+    out_count,
+):
+    """Run ``_simulate_njit`` for every combo in parallel.
+
+    Combo ``i`` reads signal row ``table_row[i]`` of the 2D input tables, uses
+    ``fee_rates[i]`` and writes its trades to row ``i`` of the output buffers.
+    """
+    for i in prange(len(fee_rates)):
+        row = table_row[i]
+        out_count[i] = _simulate_njit(
+            high,
+            low,
+            close,
+            action_table[row],
+            entry_table[row],
+            stop_table[row],
+            target_table[row],
+            fee_rates[i],
+            out_sig[i],
+            out_ent[i],
+            out_exit[i],
+            out_side[i],
+            out_entry_px[i],
+            out_sl[i],
+            out_tgt[i],
+            out_exit_px[i],
+            out_pnl[i],
+            out_reason[i],
+        )
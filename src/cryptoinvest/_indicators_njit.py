@@ -0,0 +1,139 @@
+"""Compiled exponential-average kernels used by ``indicators``.
+
+The recurrences mirror pandas ``ewm(adjust=False, ignore_na=False).mean()``,
+including the weight decay across missing values, so compiled and pandas
+results agree.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ._njit import njit
+
+
+@njit(cache=True)
+def _ewm_step(weighted, old_wt, cur, alpha):
+    """Advance one EWM step; return the new mean and carried old-value weight."""
+    old_wt_factor = 1.0 - alpha
+    new_wt = alpha
+    if weighted == weighted:
+        old_wt *= old_wt_factor
+        if alpha == 0.5:
+            # pandas re-weights across gaps when com == 1.
+            new_wt = 1.0 - old_wt
+        if cur == cur:
+            # Skip the update on equal values to avoid drift on constant series.
+            if weighted != cur:
+                weighted = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+            old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(cache=True)
+def _rsi_value(avg_gain, avg_loss, nobs, period):
+    if nobs < period:
+        return np.nan
+    if avg_loss == 0.0:
+        return 100.0
+    value = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+    return min(max(value, 0.0), 100.0)
+
+
+@njit(cache=True)
+def _ema_njit(x, alpha, min_periods, out):
+    """Exponential moving average of ``x`` written into ``out``."""
+    n = x.shape[0]
+    if n == 0:
+        return
+    weighted = x[0]
+    old_wt = 1.0
+    nobs = 1 if weighted == weighted else 0
+    out[0] = weighted if nobs >= min_periods else np.nan
+    for i in range(1, n):
+        cur = x[i]
+        if cur == cur:
+            nobs += 1
+        weighted, old_wt = _ewm_step(weighted, old_wt, cur, alpha)
+        out[i] = weighted if nobs >= min_periods else np.nan
+
+
+@njit(cache=True)
+def _rsi_njit(x, alpha, period, out):
+    """Wilder RSI of ``x`` written into ``out`` in a single pass."""
+    n = x.shape[0]
+    if n == 0:
+        return
+    # The first delta is undefined, so both averages start empty.
+    avg_gain = np.nan
+    avg_loss = np.nan
+    gain_wt = 1.0
+    loss_wt = 1.0
+    nobs = 0
+    out[0] = np.nan
+    for i in range(1, n):
+        delta = x[i] - x[i - 1]
+        if delta == delta:
+            nobs += 1
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+        else:
+            gain = np.nan
+            loss = np.nan
+        avg_gain, gain_wt = _ewm_step(avg_gain, gain_wt, gain, alpha)
+        avg_loss, loss_wt = _ewm_step(avg_loss, loss_wt, loss, alpha)
+
+        out[i] = _rsi_value(avg_gain, avg_loss, nobs, period)
+
+
+@njit(cache=True)
+def _compute_features_njit(
+    close,
+    alpha_ema7,
+    alpha_ema100,
+    alpha_fast,
+    alpha_slow,
+    alpha_signal,
+    alpha_rsi,
+    rsi_period,
+    out,
+):
+    """Fill ``out`` rows with ema7, ema100, MACD line/signal/hist and RSI in one pass."""
+    n = close.shape[0]
+    ema7 = ema100 = ema_fast = ema_slow = signal = np.nan
+    ema7_wt = ema100_wt = fast_wt = slow_wt = signal_wt = 1.0
+    avg_gain = avg_loss = np.nan
+    gain_wt = loss_wt = 1.0
+    nobs = 0
+
+    for i in range(n):
+        cur = close[i]
+        ema7, ema7_wt = _ewm_step(ema7, ema7_wt, cur, alpha_ema7)
+        ema100, ema100_wt = _ewm_step(ema100, ema100_wt, cur, alpha_ema100)
+        ema_fast, fast_wt = _ewm_step(ema_fast, fast_wt, cur, alpha_fast)
+        ema_slow, slow_wt = _ewm_step(ema_slow, slow_wt, cur, alpha_slow)
+        line = ema_fast - ema_slow
+        signal, signal_wt = _ewm_step(signal, signal_wt, line, alpha_signal)
+
+        out[0, i] = ema7
+        out[1, i] = ema100
+        out[2, i] = line
+        out[3, i] = signal
+        out[4, i] = line - signal
+
+        if i == 0:
+            out[5, i] = np.nan
+            continue
+        delta = cur - close[i - 1]
+        if delta == delta:
+            nobs += 1
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+        else:
+            gain = np.nan
+            loss = np.nan
+        avg_gain, gain_wt = _ewm_step(avg_gain, gain_wt, gain, alpha_rsi)
+        avg_loss, loss_wt = _ewm_step(avg_loss, loss_wt, loss, alpha_rsi)
+        out[5, i] = _rsi_value(avg_gain, avg_loss, nobs, rsi_period)
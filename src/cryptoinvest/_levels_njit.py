@@ -0,0 +1,93 @@
+"""Compiled pivot detection and nearest support/resistance scan for ``levels``."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ._njit import njit
+
+
+@njit(cache=True)
+def _rolling_pivots(values, window, find_max, out):
+    """Keep ``values[i]`` where it is the trailing ``window`` max (or min), else NaN.
+
+    Matches ``rolling(window, min_periods=window)``: a window holding any NaN
+    yields NaN. A monotonic deque of indices keeps this O(n).
+    """
+    n = values.shape[0]
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -1
+
+    for i in range(n):
+        out[i] = np.nan
+        x = values[i]
+        if x != x:
+            last_nan = i
+            continue
+
+        if find_max:
+            while tail > head and values[deque[tail - 1]] <= x:
+                tail -= 1
+        else:
+            while tail > head and values[deque[tail - 1]] >= x:
+                tail -= 1
+        deque[tail] = i
+        tail += 1
+        if deque[head] <= i - window:
+            head += 1
+
+        # x was just pushed, so it is the extreme iff it sits at the front.
+        if i >= window - 1 and last_nan <= i - window and values[deque[head]] == x:
+            out[i] = x
+
+
+@njit(cache=True)
+def _detect_pivots_njit(high, low, window, out_high, out_low):
+    _rolling_pivots(high, window, True, out_high)
+    _rolling_pivots(low, window, False, out_low)
+
+
+@njit(cache=True)
+def _scan_levels(close, pivot_high, pivot_low, out_res, out_sup):
+    """Fill nearest resistance/support per bar from pivots seen so far.
+
+    Seen pivots are kept in two sorted buffers, so each bar costs one
+    ``searchsorted`` per side instead of a scan over every pivot.
+    """
+    n = close.shape[0]
+    res_seen = np.empty(n, dtype=np.float64)
+    sup_seen = np.empty(n, dtype=np.float64)
+    n_res = 0
+    n_sup = 0
+
+    for i in range(n):
+        ph = pivot_high[i]
+        if ph == ph:
+            pos = np.searchsorted(res_seen[:n_res], ph)
+            for j in range(n_res, pos, -1):
+                res_seen[j] = res_seen[j - 1]
+            res_seen[pos] = ph
+            n_res += 1
+
+        pl = pivot_low[i]
+        if pl == pl:
+            pos = np.searchsorted(sup_seen[:n_sup], pl)
+            for j in range(n_sup, pos, -1):
+                sup_seen[j] = sup_seen[j - 1]
+            sup_seen[pos] = pl
+            n_sup += 1
+
+        price = close[i]
+        out_res[i] = np.nan
+        out_sup[i] = np.nan
+        if price != price:
+            continue
+
+        above = np.searchsorted(res_seen[:n_res], price, side="left")
+        if above < n_res:
+            out_res[i] = res_seen[above]
+        below = np.searchsorted(sup_seen[:n_sup], price, side="right") - 1
+        if below >= 0:
+            out_sup[i] = sup_seen[below]
@@ -0,0 +1,36 @@
+"""Optional Numba JIT decorator with a pure-Python fallback.
+
+Numba is an optional dependency (``pip install cryptoinvest[fast]``). When it is
+not installed, ``njit`` returns the decorated function unchanged so kernels still
+run as plain Python and the package keeps importing.
+
+Kernels are compiled with ``cache=True`` so short-lived CLI runs only pay the
+LLVM compile cost once; later processes load the machine code from Numba's
+on-disk cache (``__pycache__`` or ``NUMBA_CACHE_DIR``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+except ImportError:  # pragma: no cover - exercised only without numba
+    _numba_njit = None
+    prange = range
+
+HAS_NUMBA = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile with ``numba.njit`` when available, otherwise a no-op decorator."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
@@ -2,103 +2,230 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections.abc import Sequence
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from ._backtest_njit import (
+    EXIT_REASONS,
+    SIDE_LONG,
+    SIDE_NONE,
+    SIDE_SHORT,
+    _simulate_njit,
+    _sweep_njit,
+)
+from ._njit import HAS_NUMBA
 from .indicators import add_indicators
 from .levels import add_levels
 from .signals import build_signal_frame
 
 OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+TRADE_COLUMNS = [
+    "signal_time",
+    "entry_time",
+    "exit_time",
+    "side",
+    "entry",
+    "stop_loss",
+    "target",
+    "exit_price",
+    "pnl",
+    "outcome",
+    "exit_reason",
+]
+
+
+def _is_normalized_ohlcv(df: pd.DataFrame) -> bool:
+    index = df.index
+    return (
+        isinstance(index, pd.DatetimeIndex)
+        and str(index.tz) == "UTC"
+        and list(df.columns) == OHLCV_COLUMNS
+        and all(dtype == np.float64 for dtype in df.dtypes)
+        and index.is_monotonic_increasing
+        and index.is_unique
+    )
 
 
 def _normalize_ohlcv_frame(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
-    missing = set(OHLCV_COLUMNS).difference(out.columns)
+    if _is_normalized_ohlcv(df):
+        return df
+
+    missing = set(OHLCV_COLUMNS).difference(df.columns)
     if missing:
         raise ValueError(f"Missing OHLCV columns: {sorted(missing)}")
 
-    if "timestamp" in out.columns:
-        ts = out["timestamp"]
+    if "timestamp" in df.columns:
+        ts = df["timestamp"]
         if pd.api.types.is_numeric_dtype(ts):
             unit = "ms" if float(ts.max()) > 10_000_000_000 else "s"
             index = pd.to_datetime(ts, unit=unit, utc=True)
         else:
             index = pd.to_datetime(ts, utc=True)
-        out = out.drop(columns=["timestamp"])
-        out.index = index
-    elif isinstance(out.index, pd.DatetimeIndex):
-        if out.index.tz is None:
-            out.index = out.index.tz_localize("UTC")
+    elif isinstance(df.index, pd.DatetimeIndex):
+        if df.index.tz is None:
+            index = df.index.tz_localize("UTC")
         else:
-            out.index = out.index.tz_convert("UTC")
+            index = df.index.tz_convert("UTC")
     else:
         raise ValueError("Data must have a timestamp column or DatetimeIndex")
 
-    out = out[OHLCV_COLUMNS].astype(float).sort_index()
-    out = out[~out.index.duplicated(keep="last")]
+    out = df[OHLCV_COLUMNS].astype(float)
+    out.index = index
+    if not out.index.is_monotonic_increasing:
+        out = out.sort_index()
+    if not out.index.is_unique:
+        out = out[~out.index.duplicated(keep="last")]
     return out
 
 
-def fetch_ohlcv_ccxt(
-    symbol: str = "BTC/USDT",
-    timeframe: str = "4h",
-    start: str = "2025-01-01T00:00:00Z",
-    end: str = "2026-12-31T23:59:59Z",
-    exchange_id: str = "binance",
-    limit: int = 1000,
-) -> pd.DataFrame:
-    """Fetch OHLCV candles from ccxt exchange API."""
+def _iso_to_ms(value: str) -> int:
+    """Parse an ISO-8601 datetime to epoch milliseconds; naive values are UTC."""
     try:
-        import ccxt
+        ts = pd.Timestamp(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid ISO datetime for start/end") from exc
+    if ts is pd.NaT:
+        raise ValueError("Invalid ISO datetime for start/end")
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return int(ts.value // 1_000_000)
+
+
+async def _fetch_ohlcv_async(
+    symbol: str,
+    timeframe: str,
+    start: str,
+    end: str,
+    exchange_id: str,
+    limit: int,
+    concurrency: int,
+) -> np.ndarray:
+    """Fetch candle pages concurrently, one ``limit``-sized time window per task."""
+    try:
+        import ccxt.async_support as ccxt_async
     except ImportError as exc:
         raise ImportError("ccxt is required for network fetches") from exc
 
-    exchange_class = getattr(ccxt, exchange_id, None)
+    exchange_class = getattr(ccxt_async, exchange_id, None)
     if exchange_class is None:
         raise ValueError(f"Unsupported exchange: {exchange_id}")
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    since_ms = _iso_to_ms(start)
+    end_ms = _iso_to_ms(end)
 
     exchange = exchange_class({"enableRateLimit": True})
-    since_ms = exchange.parse8601(start)
-    end_ms = exchange.parse8601(end)
-    if since_ms is None or end_ms is None:
-        raise ValueError("Invalid ISO datetime for start/end")
-
-    rows: list[list[float]] = []
-    while since_ms < end_ms:
-        batch = exchange.fetch_ohlcv(
-            symbol=symbol, timeframe=timeframe, since=since_ms, limit=limit
+    try:
+        timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
+        window_ms = timeframe_ms * limit
+        windows = range(since_ms, end_ms + 1, window_ms)
+        # Each window spans ``limit`` candles, so it owns a fixed slot of rows.
+        buffer = np.empty((len(windows) * limit, 6), dtype=np.float64)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_window(slot: int, window_start: int) -> int:
+            window_end = min(window_start + window_ms, end_ms + 1)
+            offset = slot * limit
+            filled = 0
+            cursor = window_start
+            async with semaphore:
+                # Keep paging inside the window in case the exchange caps the
+                # page size below ``limit``.
+                while cursor < window_end and filled < limit:
+                    batch = await exchange.fetch_ohlcv(
+                        symbol=symbol, timeframe=timeframe, since=cursor, limit=limit
+                    )
+                    if not batch:
+                        break
+                    candles = np.asarray(batch, dtype=np.float64)[:, :6]
+                    candles = candles[candles[:, 0] < window_end][: limit - filled]
+                    buffer[offset + filled : offset + filled + len(candles)] = candles
+                    filled += len(candles)
+                    last_ts = int(batch[-1][0])
+                    if last_ts <= cursor or last_ts + timeframe_ms >= window_end:
+                        break
+                    cursor = last_ts + 1
+            return filled
+
+        counts = await asyncio.gather(
+            *(fetch_window(slot, window) for slot, window in enumerate(windows))
         )
-        if not batch:
-            break
+    finally:
+        await exchange.close()
 
-        for candle in batch:
-            ts = candle[0]
-            if ts > end_ms:
-                continue
-            rows.append(candle[:6])
-
-        last_ts = int(batch[-1][0])
-        if last_ts <= since_ms:
-            break
-        since_ms = last_ts + 1
+    if not counts:
+        return buffer
+    return np.concatenate(
+        [buffer[slot * limit : slot * limit + count] for slot, count in enumerate(counts)]
+    )
 
-        if len(batch) < limit and last_ts >= end_ms:
-            break
 
-    if not rows:
+def fetch_ohlcv_ccxt(
+    symbol: str = "BTC/USDT",
+    timeframe: str = "4h",
+    start: str = "2025-01-01T00:00:00Z",
+    end: str = "2026-12-31T23:59:59Z",
+    exchange_id: str = "binance",
+    limit: int = 1000,
+    concurrency: int = 4,
+) -> pd.DataFrame:
+    """Fetch OHLCV candles from ccxt exchange API."""
+    candles = asyncio.run(
+        _fetch_ohlcv_async(
+            symbol=symbol,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            exchange_id=exchange_id,
+            limit=limit,
+            concurrency=concurrency,
+        )
+    )
+    if not len(candles):
         raise ValueError("No OHLCV data returned from exchange")
 
-    raw = pd.DataFrame(rows, columns=["timestamp", *OHLCV_COLUMNS])
+    raw = pd.DataFrame(candles, columns=["timestamp", *OHLCV_COLUMNS])
     raw = raw.drop_duplicates(subset=["timestamp"], keep="last")
     return _normalize_ohlcv_frame(raw)
 
 
-def load_ohlcv_csv(path: str | Path) -> pd.DataFrame:
-    """Load OHLCV candles from CSV."""
-    raw = pd.read_csv(path)
+def _read_csv_arrow(path: str | Path) -> pd.DataFrame:
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError as exc:
+        raise ImportError("pyarrow is required for fast CSV loading") from exc
+
+    # Read timestamps as text: pyarrow would otherwise parse ISO strings itself
+    # and pick a different datetime unit than ``pd.to_datetime`` does.
+    column_types = {column: pa.float64() for column in OHLCV_COLUMNS}
+    column_types["timestamp"] = pa.string()
+    convert_options = pacsv.ConvertOptions(column_types=column_types)
+    table = pacsv.read_csv(str(path), convert_options=convert_options)
+
+    # Epoch timestamps become numbers again, as ``pd.read_csv`` would infer.
+    position = table.schema.get_field_index("timestamp")
+    if position >= 0:
+        for numeric_type in (pa.int64(), pa.float64()):
+            try:
+                column = table.column(position).cast(numeric_type)
+            except pa.ArrowInvalid:
+                continue
+            table = table.set_column(position, "timestamp", column)
+            break
+    return table.to_pandas(self_destruct=True)
+
+
+def load_ohlcv_csv(path: str | Path, fast_io: bool = False) -> pd.DataFrame:
+    """Load OHLCV candles from CSV, optionally with pyarrow's columnar parser."""
+    raw = _read_csv_arrow(path) if fast_io else pd.read_csv(path)
     if "timestamp" not in raw.columns:
         raise ValueError("CSV must include timestamp column")
     return _normalize_ohlcv_frame(raw)
@@ -112,28 +239,81 @@ def prepare_dataset(df: pd.DataFrame, pivot_window: int = 3) -> pd.DataFrame:
     return with_levels
 
 
-def build_backtest_frame(df: pd.DataFrame, pivot_window: int = 3) -> pd.DataFrame:
-    """Build complete frame with features and signal columns."""
-    prepared = prepare_dataset(df, pivot_window=pivot_window)
+# Bump when feature engineering changes so stale cache files are not reused.
+_PREPARED_CACHE_VERSION = 1
+
+
+def _prepared_cache_path(
+    csv_path: str | Path, pivot_window: int, fast_io: bool, cache_dir: str | Path
+) -> Path:
+    source = Path(csv_path).resolve()
+    stat = source.stat()
+    # The two CSV readers can differ in the last ulp, so each gets its own entry.
+    fingerprint = (
+        f"{_PREPARED_CACHE_VERSION}:{source}:{stat.st_mtime_ns}:{stat.st_size}"
+        f":{pivot_window}:{int(fast_io)}"
+    )
+    key = hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()
+    return Path(cache_dir) / f"{key}.feather"
+
+
+def load_prepared_csv(
+    path: str | Path,
+    pivot_window: int = 3,
+    cache_dir: str | Path | None = None,
+    fast_io: bool = False,
+) -> pd.DataFrame:
+    """Load a CSV and prepare it, optionally memoized as Feather under ``cache_dir``.
+
+    Cache entries are keyed on the CSV path, modification time, size,
+    ``pivot_window`` and ``fast_io``; editing the CSV invalidates them.
+    """
+    if cache_dir is None:
+        return prepare_dataset(load_ohlcv_csv(path, fast_io=fast_io), pivot_window=pivot_window)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("pyarrow is required for the prepared dataset cache") from exc
+
+    cache_path = _prepared_cache_path(path, pivot_window, fast_io, cache_dir)
+    if cache_path.exists():
+        return pd.read_feather(cache_path)
+
+    prepared = prepare_dataset(load_ohlcv_csv(path, fast_io=fast_io), pivot_window=pivot_window)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Each writer uses its own temp file and renames it into place, so a
+    # concurrent run never reads a partial or interleaved file.
+    with tempfile.NamedTemporaryFile(
+        dir=cache_path.parent, prefix=cache_path.stem, suffix=".tmp", delete=False
+    ) as handle:
+        partial = Path(handle.name)
+    try:
+        prepared.to_feather(partial, compression="zstd")
+        os.replace(partial, cache_path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return prepared
+
+
+def _add_signal_columns(prepared: pd.DataFrame) -> pd.DataFrame:
     signal_df = build_signal_frame(prepared)
-    return pd.concat([prepared, signal_df], axis=1)
+    # ``prepared`` is a fresh frame owned here and ``signal_df`` shares its
+    # index, so append the columns in place rather than concatenating copies.
+    for column in signal_df.columns:
+        prepared[column] = signal_df[column].to_numpy()
+    return prepared
 
 
-def _is_valid_order(action: str, entry: float, stop: float, target: float) -> bool:
-    if action == "long":
-        return stop < entry < target
-    if action == "short":
-        return target < entry < stop
-    return False
+def build_backtest_frame(df: pd.DataFrame, pivot_window: int = 3) -> pd.DataFrame:
+    """Build complete frame with features and signal columns."""
+    return _add_signal_columns(prepare_dataset(df, pivot_window=pivot_window))
 
 
-def _trade_pnl(side: str, entry: float, exit_price: float, fee_rate: float) -> float:
-    if side == "long":
-        gross = (exit_price - entry) / entry
-    else:
-        gross = (entry - exit_price) / entry
-    # Approximate round-trip fee as linear in notional.
-    return gross - (2 * fee_rate)
+def _float_column(frame: pd.DataFrame, column: str) -> np.ndarray:
+    values = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.ascontiguousarray(values)
 
 
 def compute_metrics(trades: pd.DataFrame) -> dict[str, float | int]:
@@ -148,23 +328,81 @@ def compute_metrics(trades: pd.DataFrame) -> dict[str, float | int]:
             "trades_count": 0,
         }
 
-    pnl = trades["pnl"].astype(float)
+    pnl = trades["pnl"].to_numpy(dtype=np.float64)
     wins = pnl[pnl > 0]
     losses = pnl[pnl < 0]
-    equity_curve = (1 + pnl).cumprod()
-    peaks = equity_curve.cummax()
+    equity_curve = np.cumprod(1.0 + pnl)
+    peaks = np.maximum.accumulate(equity_curve)
     drawdowns = (equity_curve / peaks) - 1.0
 
     return {
-        "win_rate": float((pnl > 0).mean() * 100.0),
+        "win_rate": float(len(wins) / len(pnl) * 100.0),
         "avg_pl": float(pnl.mean()),
-        "avg_win": float(wins.mean()) if not wins.empty else 0.0,
-        "avg_loss": float(losses.mean()) if not losses.empty else 0.0,
+        "avg_win": float(wins.mean()) if len(wins) else 0.0,
+        "avg_loss": float(losses.mean()) if len(losses) else 0.0,
         "max_drawdown": float(drawdowns.min()),
         "trades_count": int(len(trades)),
     }
 
 
+def _eval_window(frame: pd.DataFrame, eval_start: str, eval_end: str) -> pd.DataFrame:
+    start_ts = pd.Timestamp(eval_start, tz="UTC")
+    end_ts = pd.Timestamp(eval_end, tz="UTC")
+    index = frame.index
+    if index.is_monotonic_increasing:
+        lo = index.searchsorted(start_ts, side="left")
+        hi = index.searchsorted(end_ts, side="right")
+        return frame.iloc[lo:hi]
+    return frame.loc[(index >= start_ts) & (index <= end_ts)]
+
+
+def _action_codes(frame: pd.DataFrame) -> np.ndarray:
+    actions = frame["action"].to_numpy(dtype=object)
+    return np.where(
+        actions == "long", SIDE_LONG, np.where(actions == "short", SIDE_SHORT, SIDE_NONE)
+    ).astype(np.int8)
+
+
+def _trade_buffers(shape: int | tuple[int, int]) -> tuple[np.ndarray, ...]:
+    """Allocate kernel output buffers in ``_simulate_njit`` argument order."""
+    return (
+        np.empty(shape, dtype=np.int64),  # signal bar
+        np.empty(shape, dtype=np.int64),  # entry bar
+        np.empty(shape, dtype=np.int64),  # exit bar
+        np.empty(shape, dtype=np.int8),  # side
+        np.empty(shape, dtype=np.float64),  # entry
+        np.empty(shape, dtype=np.float64),  # stop_loss
+        np.empty(shape, dtype=np.float64),  # target
+        np.empty(shape, dtype=np.float64),  # exit_price
+        np.empty(shape, dtype=np.float64),  # pnl
+        np.empty(shape, dtype=np.int8),  # exit_reason
+    )
+
+
+def _trades_frame(
+    index: pd.DatetimeIndex, count: int, buffers: Sequence[np.ndarray]
+) -> pd.DataFrame:
+    sig, ent, exit_bar, side, entry, stop, target, exit_px, pnl, reason = (
+        buffer[:count] for buffer in buffers
+    )
+    return pd.DataFrame(
+        {
+            "signal_time": index[sig],
+            "entry_time": index[ent],
+            "exit_time": index[exit_bar],
+            "side": np.where(side == SIDE_LONG, "long", "short").astype(object),
+            "entry": entry,
+            "stop_loss": stop,
+            "target": target,
+            "exit_price": exit_px,
+            "pnl": pnl,
+            "outcome": np.where(pnl > 0, "win", np.where(pnl < 0, "loss", "flat")).astype(object),
+            "exit_reason": np.asarray(EXIT_REASONS, dtype=object)[reason],
+        },
+        columns=TRADE_COLUMNS,
+    )
+
+
 def simulate_trades(
     frame: pd.DataFrame,
     eval_start: str = "2025-01-01",
@@ -179,141 +417,88 @@ def simulate_trades(
     if not isinstance(frame.index, pd.DatetimeIndex):
         raise ValueError("Backtest frame index must be DatetimeIndex")
 
-    start_ts = pd.Timestamp(eval_start, tz="UTC")
-    end_ts = pd.Timestamp(eval_end, tz="UTC")
-    data = frame.loc[(frame.index >= start_ts) & (frame.index <= end_ts)].copy()
+    data = _eval_window(frame, eval_start, eval_end)
     if data.empty:
-        empty = pd.DataFrame(
-            columns=[
-                "signal_time",
-                "entry_time",
-                "exit_time",
-                "side",
-                "entry",
-                "stop_loss",
-                "target",
-                "exit_price",
-                "pnl",
-                "outcome",
-                "exit_reason",
-            ]
-        )
+        empty = pd.DataFrame(columns=TRADE_COLUMNS)
         return empty, compute_metrics(empty)
 
-    trades: list[dict[str, object]] = []
-    pending_order: dict[str, object] | None = None
-    open_trade: dict[str, object] | None = None
-
-    for ts, row in data.iterrows():
-        if open_trade is None and pending_order is not None:
-            open_trade = {
-                "signal_time": pending_order["signal_time"],
-                "entry_time": ts,
-                "side": pending_order["side"],
-                "entry": pending_order["entry"],
-                "stop_loss": pending_order["stop_loss"],
-                "target": pending_order["target"],
-            }
-            pending_order = None
-
-        if open_trade is not None:
-            side = str(open_trade["side"])
-            stop_loss = float(open_trade["stop_loss"])
-            target = float(open_trade["target"])
-            entry = float(open_trade["entry"])
-
-            high = float(row["high"])
-            low = float(row["low"])
-            exit_price = None
-            exit_reason = None
-
-            if side == "long":
-                hit_stop = low <= stop_loss
-                hit_target = high >= target
-                if hit_stop and hit_target:
-                    exit_price = stop_loss
-                    exit_reason = "stop_and_target_same_candle"
-                elif hit_stop:
-                    exit_price = stop_loss
-                    exit_reason = "stop_loss"
-                elif hit_target:
-                    exit_price = target
-                    exit_reason = "target"
-            else:
-                hit_stop = high >= stop_loss
-                hit_target = low <= target
-                if hit_stop and hit_target:
-                    exit_price = stop_loss
-                    exit_reason = "stop_and_target_same_candle"
-                elif hit_stop:
-                    exit_price = stop_loss
-                    exit_reason = "stop_loss"
-                elif hit_target:
-                    exit_price = target
-                    exit_reason = "target"
-
-            if exit_price is not None:
-                pnl = _trade_pnl(side, entry, float(exit_price), fee_rate=fee_rate)
-                trades.append(
-                    {
-                        "signal_time": open_trade["signal_time"],
-                        "entry_time": open_trade["entry_time"],
-                        "exit_time": ts,
-                        "side": side,
-                        "entry": entry,
-                        "stop_loss": stop_loss,
-                        "target": target,
-                        "exit_price": float(exit_price),
-                        "pnl": pnl,
-                        "outcome": "win" if pnl > 0 else ("loss" if pnl < 0 else "flat"),
-                        "exit_reason": exit_reason,
-                    }
-                )
-                open_trade = None
-
-        if open_trade is None and pending_order is None:
-            action = str(row["action"])
-            entry = row["entry"]
-            stop_loss = row["stop_loss"]
-            target = row["target"]
-
-            if action in {"long", "short"} and pd.notna(entry) and pd.notna(stop_loss) and pd.notna(target):
-                entry_f = float(entry)
-                stop_f = float(stop_loss)
-                target_f = float(target)
-                if _is_valid_order(action, entry_f, stop_f, target_f):
-                    pending_order = {
-                        "signal_time": ts,
-                        "side": action,
-                        "entry": entry_f,
-                        "stop_loss": stop_f,
-                        "target": target_f,
-                    }
-
-    if open_trade is not None:
-        final_ts = data.index[-1]
-        final_close = float(data.iloc[-1]["close"])
-        side = str(open_trade["side"])
-        entry = float(open_trade["entry"])
-        pnl = _trade_pnl(side, entry, final_close, fee_rate=fee_rate)
-        trades.append(
-            {
-                "signal_time": open_trade["signal_time"],
-                "entry_time": open_trade["entry_time"],
-                "exit_time": final_ts,
-                "side": side,
-                "entry": entry,
-                "stop_loss": float(open_trade["stop_loss"]),
-                "target": float(open_trade["target"]),
-                "exit_price": final_close,
-                "pnl": pnl,
-                "outcome": "win" if pnl > 0 else ("loss" if pnl < 0 else "flat"),
-                "exit_reason": "end_of_data",
-            }
+    inputs = [
+        _float_column(data, "high"),
+        _float_column(data, "low"),
+        _float_column(data, "close"),
+        _action_codes(data),
+        _float_column(data, "entry"),
+        _float_column(data, "stop_loss"),
+        _float_column(data, "target"),
+    ]
+    if not HAS_NUMBA:
+        # The kernel runs interpreted; plain floats index faster than NumPy scalars.
+        inputs = [column.tolist() for column in inputs]
+
+    buffers = _trade_buffers(len(data))
+    count = _simulate_njit(*inputs, float(fee_rate), *buffers)
+    trades_df = _trades_frame(data.index, count, buffers)
+    return trades_df, compute_metrics(trades_df)
+
+
+def run_backtest_sweep(
+    frame: pd.DataFrame,
+    pivot_windows: Sequence[int],
+    fee_rates: Sequence[float],
+    eval_start: str = "2025-01-01",
+    eval_end: str = "2026-12-31",
+) -> pd.DataFrame:
+    """Backtest every ``(pivot_window, fee_rate)`` pair on one OHLCV frame.
+
+    Indicators are computed once; levels and signals once per pivot window. The
+    simulations then run in parallel (one Numba thread per combo when numba is
+    installed). Returns one row of metrics per combo.
+    """
+    if len(pivot_windows) == 0 or len(fee_rates) == 0:
+        raise ValueError("pivot_windows and fee_rates must not be empty")
+
+    with_indicators = add_indicators(_normalize_ohlcv_frame(frame))
+    data = _eval_window(with_indicators, eval_start, eval_end)
+    n = len(data)
+    n_windows = len(pivot_windows)
+
+    action_table = np.empty((n_windows, n), dtype=np.int8)
+    entry_table = np.empty((n_windows, n), dtype=np.float64)
+    stop_table = np.empty((n_windows, n), dtype=np.float64)
+    target_table = np.empty((n_windows, n), dtype=np.float64)
+    for row, window in enumerate(pivot_windows):
+        prepared = add_levels(with_indicators, window=window)
+        signals = _eval_window(build_signal_frame(prepared), eval_start, eval_end)
+        action_table[row] = _action_codes(signals)
+        entry_table[row] = _float_column(signals, "entry")
+        stop_table[row] = _float_column(signals, "stop_loss")
+        target_table[row] = _float_column(signals, "target")
+
+    combos = [(row, window, fee) for row, window in enumerate(pivot_windows) for fee in fee_rates]
+    table_row = np.array([row for row, _window, _fee in combos], dtype=np.int64)
+    combo_fees = np.array([fee for _row, _window, fee in combos], dtype=np.float64)
+    buffers = _trade_buffers((len(combos), n))
+    counts = np.zeros(len(combos), dtype=np.int64)
+    if n:
+        _sweep_njit(
+            _float_column(data, "high"),
+            _float_column(data, "low"),
+            _float_column(data, "close"),
+            action_table,
+            entry_table,
+            stop_table,
+            target_table,
+            table_row,
+            combo_fees,
+            *buffers,
+            counts,
         )
 
-    trades_df = pd.DataFrame(trades)
-    return trades_df, compute_metrics(trades_df)
+    results = []
+    for i, (_row, window, fee) in enumerate(combos):
+        trades = _trades_frame(data.index, int(counts[i]), [buffer[i] for buffer in buffers])
+        results.append({"pivot_window": window, "fee_rate": fee, **compute_metrics(trades)})
+    return pd.DataFrame(results)
 
 
 def run_backtest(
@@ -328,10 +513,19 @@ def run_backtest(
     limit: int = 1000,
     pivot_window: int = 3,
     fee_rate: float = 0.0,
+    fast_io: bool = False,
+    fetch_concurrency: int = 4,
+    cache_dir: str | Path | None = None,
 ) -> tuple[dict[str, float | int], pd.DataFrame, pd.DataFrame]:
-    """End-to-end backtest from CSV or ccxt."""
+    """End-to-end backtest from CSV or ccxt.
+
+    With ``csv_path`` and ``cache_dir`` set, the prepared dataset is reused
+    from the on-disk cache (see ``load_prepared_csv``).
+    """
     if csv_path:
-        raw = load_ohlcv_csv(csv_path)
+        prepared = load_prepared_csv(
+            csv_path, pivot_window=pivot_window, cache_dir=cache_dir, fast_io=fast_io
+        )
     else:
         raw = fetch_ohlcv_ccxt(
             symbol=symbol,
@@ -340,9 +534,11 @@ def run_backtest(
             end=end,
             exchange_id=exchange_id,
             limit=limit,
+            concurrency=fetch_concurrency,
         )
+        prepared = prepare_dataset(raw, pivot_window=pivot_window)
 
-    frame = build_backtest_frame(raw, pivot_window=pivot_window)
+    frame = _add_signal_columns(prepared)
     trades, metrics = simulate_trades(
         frame, eval_start=eval_start, eval_end=eval_end, fee_rate=fee_rate
     )
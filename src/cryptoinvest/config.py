@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import cache
 
 
 def _env_str(name: str, default: str) -> str:
@@ -25,6 +26,13 @@ def _env_float(name: str, default: float) -> float:
     return float(value)
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
 @dataclass(frozen=True)
 class Settings:
     symbol: str = "BTC/USDT"
@@ -35,15 +43,25 @@ class Settings:
     eval_start: str = "2025-01-01"
     eval_end: str = "2026-12-31"
     limit: int = 1000
+    fetch_concurrency: int = 4
     pivot_window: int = 3
     csv_path: str | None = None
     fee_rate: float = 0.0
+    fast_io: bool = False
+    cache_dir: str | None = None
 
 
+@cache
 def load_settings() -> Settings:
-    """Load settings from environment variables."""
+    """Load settings from environment variables.
+
+    The result is cached per process; call ``load_settings.cache_clear()`` to
+    re-read the environment.
+    """
     csv_path = os.getenv("CRYPTOINVEST_CSV_PATH")
     csv_value = csv_path.strip() if csv_path and csv_path.strip() else None
+    cache_dir = os.getenv("CRYPTOINVEST_CACHE_DIR")
+    cache_value = cache_dir.strip() if cache_dir and cache_dir.strip() else None
     return Settings(
         symbol=_env_str("CRYPTOINVEST_SYMBOL", "BTC/USDT"),
         timeframe=_env_str("CRYPTOINVEST_TIMEFRAME", "4h"),
@@ -53,7 +71,10 @@ def load_settings() -> Settings:
         eval_start=_env_str("CRYPTOINVEST_EVAL_START", "2025-01-01"),
         eval_end=_env_str("CRYPTOINVEST_EVAL_END", "2026-12-31"),
         limit=_env_int("CRYPTOINVEST_LIMIT", 1000),
+        fetch_concurrency=_env_int("CRYPTOINVEST_FETCH_CONCURRENCY", 4),
         pivot_window=_env_int("CRYPTOINVEST_PIVOT_WINDOW", 3),
         csv_path=csv_value,
         fee_rate=_env_float("CRYPTOINVEST_FEE_RATE", 0.0),
+        fast_io=_env_bool("CRYPTOINVEST_FAST_IO", False),
+        cache_dir=cache_value,
     )
@@ -5,12 +5,43 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from ._indicators_njit import _compute_features_njit, _ema_njit, _rsi_njit
+from ._njit import HAS_NUMBA
+
+
+def _float_values(series: pd.Series) -> np.ndarray:
+    return np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+
+
+def _pandas_alpha(com: float) -> float:
+    # pandas derives alpha from the center of mass; mirror it to stay bit-identical.
+    return 1.0 / (1.0 + com)
+
+
+def _span_com(span: int) -> float:
+    return (span - 1) / 2.0
+
+
+def _wilder_com(period: int) -> float:
+    alpha = 1 / period
+    return (1 - alpha) / alpha
+
+
+def _ewm_mean(series: pd.Series, com: float, min_periods: int = 0) -> pd.Series:
+    """``ewm(com=com, adjust=False).mean()``, compiled when numba is available."""
+    if not HAS_NUMBA:
+        return series.ewm(com=com, adjust=False, min_periods=min_periods).mean()
+    values = _float_values(series)
+    out = np.empty_like(values)
+    _ema_njit(values, _pandas_alpha(com), max(min_periods, 1), out)
+    return pd.Series(out, index=series.index, name=series.name)
+
 
 def ema(series: pd.Series, period: int) -> pd.Series:
     """Exponential moving average with recursive form (adjust=False)."""
     if period <= 0:
         raise ValueError("period must be positive")
-    return series.astype(float).ewm(span=period, adjust=False).mean()
+    return _ewm_mean(series.astype(float), com=_span_com(period))
 
 
 def macd(
@@ -26,7 +57,7 @@ def macd(
     ema_fast = ema(close, fast)
     ema_slow = ema(close, slow)
     macd_line = ema_fast - ema_slow
-    macd_signal = macd_line.ewm(span=signal, adjust=False).mean()
+    macd_signal = _ewm_mean(macd_line, com=_span_com(signal))
     macd_hist = macd_line - macd_signal
     return pd.DataFrame(
         {
@@ -44,17 +75,27 @@ def rsi(series: pd.Series, period: int = 6) -> pd.Series:
         raise ValueError("period must be positive")
 
     series = series.astype(float)
-    delta = series.diff()
-    gain = delta.clip(lower=0.0)
-    loss = -delta.clip(upper=0.0)
-
-    avg_gain = gain.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
-    avg_loss = loss.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
-
-    rs = avg_gain / avg_loss.replace(0, np.nan)
+    if HAS_NUMBA:
+        out = np.empty(len(series), dtype=np.float64)
+        _rsi_njit(_float_values(series), _pandas_alpha(_wilder_com(period)), period, out)
+        return pd.Series(out, index=series.index, name=series.name)
+
+    values = _float_values(series)
+    delta = np.empty_like(values)
+    delta[:1] = np.nan
+    np.subtract(values[1:], values[:-1], out=delta[1:])
+    gain = pd.Series(np.maximum(delta, 0.0))
+    loss = pd.Series(np.maximum(-delta, 0.0))
+
+    com = _wilder_com(period)
+    avg_gain = _ewm_mean(gain, com, min_periods=period).to_numpy()
+    avg_loss = _ewm_mean(loss, com, min_periods=period).to_numpy()
+
+    # A zero average loss maps to rs=inf, i.e. RSI 100.
+    rs = np.divide(avg_gain, avg_loss, out=np.full_like(avg_gain, np.inf), where=avg_loss != 0)
     out = 100.0 - (100.0 / (1.0 + rs))
-    out = out.where(avg_loss != 0, 100.0)
-    return out.clip(lower=0.0, upper=100.0)
+    np.clip(out, 0.0, 100.0, out=out)
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def volume_ma(volume: pd.Series, window: int = 5) -> pd.Series:
@@ -71,12 +112,42 @@ def add_indicators(df: pd.DataFrame) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Missing required columns: {sorted(missing)}")
 
-    out = df.copy()
-    out["price"] = out["close"].astype(float)
-    out["ema7"] = ema(out["close"], 7)
-    out["ema100"] = ema(out["close"], 100)
-    macd_df = macd(out["close"], fast=12, slow=26, signal=9)
-    out = out.join(macd_df)
-    out["rsi6"] = rsi(out["close"], period=6)
-    out["ma5_volume"] = volume_ma(out["volume"], window=5)
-    return out
+    close = df["close"].astype(float)
+    if HAS_NUMBA:
+        features = np.empty((6, len(close)), dtype=np.float64)
+        _compute_features_njit(
+            _float_values(close),
+            _pandas_alpha(_span_com(7)),
+            _pandas_alpha(_span_com(100)),
+            _pandas_alpha(_span_com(12)),
+            _pandas_alpha(_span_com(26)),
+            _pandas_alpha(_span_com(9)),
+            _pandas_alpha(_wilder_com(6)),
+            6,
+            features,
+        )
+        ema7, ema100, macd_line, macd_signal, macd_hist, rsi6 = features
+    else:
+        ema7 = ema(close, 7)
+        ema100 = ema(close, 100)
+        macd_df = macd(close, fast=12, slow=26, signal=9)
+        macd_line = macd_df["macd_line"]
+        macd_signal = macd_df["macd_signal"]
+        macd_hist = macd_df["macd_hist"]
+        rsi6 = rsi(close, period=6)
+
+    new_cols = pd.DataFrame(
+        {
+            "price": close,
+            "ema7": ema7,
+            "ema100": ema100,
+            "macd_line": macd_line,
+            "macd_signal": macd_signal,
+            "macd_hist": macd_hist,
+            "rsi6": rsi6,
+            "ma5_volume": volume_ma(df["volume"], window=5),
+        },
+        index=df.index,
+    )
+    out = df.drop(columns=new_cols.columns, errors="ignore")
+    return pd.concat([out, new_cols], axis=1)
@@ -13,9 +13,15 @@ Method:
 
 from __future__ import annotations
 
+import bisect
+import math
+
 import numpy as np
 import pandas as pd
 
+from ._levels_njit import _detect_pivots_njit, _scan_levels
+from ._njit import HAS_NUMBA
+
 
 def detect_pivots(df: pd.DataFrame, window: int = 3) -> pd.DataFrame:
     """Return pivot_high and pivot_low columns."""
@@ -25,6 +31,20 @@ def detect_pivots(df: pd.DataFrame, window: int = 3) -> pd.DataFrame:
         raise ValueError("DataFrame must contain high and low columns")
 
     out = df.copy()
+    if HAS_NUMBA:
+        pivot_high = np.empty(len(out), dtype=np.float64)
+        pivot_low = np.empty(len(out), dtype=np.float64)
+        _detect_pivots_njit(
+            np.ascontiguousarray(out["high"].to_numpy(dtype=np.float64)),
+            np.ascontiguousarray(out["low"].to_numpy(dtype=np.float64)),
+            window,
+            pivot_high,
+            pivot_low,
+        )
+        out["pivot_high"] = pivot_high
+        out["pivot_low"] = pivot_low
+        return out
+
     rolling_high = out["high"].rolling(window, min_periods=window).max()
     rolling_low = out["low"].rolling(window, min_periods=window).min()
 
@@ -33,33 +53,55 @@ def detect_pivots(df: pd.DataFrame, window: int = 3) -> pd.DataFrame:
     return out
 
 
+def _nearest_levels_sorted(
+    close: np.ndarray, pivot_high: np.ndarray, pivot_low: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pure-Python fallback for ``_scan_levels`` when numba is not installed.
+
+    Seen pivots live in sorted lists, so each bar is two bisections rather
+    than a scan over every pivot.
+    """
+    resistances: list[float] = []
+    supports: list[float] = []
+    nearest_resistance = np.full(len(close), np.nan)
+    nearest_support = np.full(len(close), np.nan)
+
+    rows = zip(close.tolist(), pivot_high.tolist(), pivot_low.tolist())
+    for i, (price, high, low) in enumerate(rows):
+        if not math.isnan(high):
+            bisect.insort(resistances, high)
+        if not math.isnan(low):
+            bisect.insort(supports, low)
+        if math.isnan(price):
+            continue
+
+        above = bisect.bisect_left(resistances, price)
+        if above < len(resistances):
+            nearest_resistance[i] = resistances[above]
+        below = bisect.bisect_right(supports, price) - 1
+        if below >= 0:
+            nearest_support[i] = supports[below]
+    return nearest_resistance, nearest_support
+
+
 def add_levels(df: pd.DataFrame, window: int = 3) -> pd.DataFrame:
     """Add nearest resistance/support columns from rolling pivots."""
     if "close" not in df.columns:
         raise ValueError("DataFrame must contain close column")
 
     out = detect_pivots(df, window=window)
-    supports_seen: list[float] = []
-    resistances_seen: list[float] = []
-
-    nearest_resistance: list[float] = []
-    nearest_support: list[float] = []
-
-    for _, row in out.iterrows():
-        pivot_high = row["pivot_high"]
-        pivot_low = row["pivot_low"]
-
-        if pd.notna(pivot_high):
-            resistances_seen.append(float(pivot_high))
-        if pd.notna(pivot_low):
-            supports_seen.append(float(pivot_low))
-
-        price = float(row["close"])
-        above = [r for r in resistances_seen if r >= price]
-        below = [s for s in supports_seen if s <= price]
-
-        nearest_resistance.append(min(above) if above else np.nan)
-        nearest_support.append(max(below) if below else np.nan)
+    close = np.ascontiguousarray(out["close"].to_numpy(dtype=np.float64))
+    pivot_high = np.ascontiguousarray(out["pivot_high"].to_numpy(dtype=np.float64))
+    pivot_low = np.ascontiguousarray(out["pivot_low"].to_numpy(dtype=np.float64))
+
+    if HAS_NUMBA:
+        nearest_resistance = np.empty(len(out), dtype=np.float64)
+        nearest_support = np.empty(len(out), dtype=np.float64)
+        _scan_levels(close, pivot_high, pivot_low, nearest_resistance, nearest_support)
+    else:
+        nearest_resistance, nearest_support = _nearest_levels_sorted(
+            close, pivot_high, pivot_low
+        )
 
     out["nearest_resistance"] = nearest_resistance
     out["nearest_support"] = nearest_support
@@ -5,8 +5,23 @@ from __future__ import annotations
 import math
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+SIGNAL_COLUMNS = ["action", "entry", "stop_loss", "target", "rr_ratio"]
+# Rule inputs in the positional order taken by ``_signal_from_floats``.
+SIGNAL_INPUTS = (
+    "price",
+    "ema7",
+    "macd_hist",
+    "macd_line",
+    "rsi6",
+    "volume",
+    "ma5_volume",
+    "nearest_resistance",
+    "nearest_support",
+)
+
 
 def _to_float_or_none(value: Any) -> float | None:
     if value is None:
@@ -20,16 +35,18 @@ def _to_float_or_none(value: Any) -> float | None:
     return number
 
 
-def signal_from_row(row: pd.Series) -> dict[str, float | str | None]:
-    """Evaluate strategy rules on one candle row."""
-    price = _to_float_or_none(row.get("price"))
-    ema7 = _to_float_or_none(row.get("ema7"))
-    macd_hist = _to_float_or_none(row.get("macd_hist"))
-    macd_line = _to_float_or_none(row.get("macd_line"))
-    rsi6 = _to_float_or_none(row.get("rsi6"))
-    volume = _to_float_or_none(row.get("volume"))
-    ma5_volume = _to_float_or_none(row.get("ma5_volume"))
-
+def _signal_from_floats(
+    price: float | None,
+    ema7: float | None,
+    macd_hist: float | None,
+    macd_line: float | None,
+    rsi6: float | None,
+    volume: float | None,
+    ma5_volume: float | None,
+    nearest_resistance: float | None,
+    nearest_support: float | None,
+) -> dict[str, float | str | None]:
+    """Evaluate strategy rules on finite floats, with ``None`` for missing inputs."""
     if price is None or ema7 is None or ema7 == 0:
         return {
             "action": "wait",
@@ -39,7 +56,9 @@ def signal_from_row(row: pd.Series) -> dict[str, float | str | None]:
             "rr_ratio": None,
         }
 
-    near_ema = (price - ema7) / ema7 < 0.01
+    # Within 1% above the EMA; the long entry sits exactly on this threshold.
+    near_ema_limit = ema7 * 1.01
+    near_ema = price < near_ema_limit
     macd_long_ok = (macd_hist is not None and macd_hist > 0) or (
         macd_line is not None and macd_line > 0
     )
@@ -56,9 +75,9 @@ def signal_from_row(row: pd.Series) -> dict[str, float | str | None]:
     is_short = price < ema7 and macd_short_ok and rsi_short_ok
 
     if is_long:
-        entry = ema7 * 1.01
+        entry = near_ema_limit
         stop_loss = ema7 * 0.985
-        target = _to_float_or_none(row.get("nearest_resistance"))
+        target = nearest_resistance
         rr_ratio = None
         if target is not None and entry > stop_loss and target > entry:
             rr_ratio = (target - entry) / (entry - stop_loss)
@@ -73,7 +92,7 @@ def signal_from_row(row: pd.Series) -> dict[str, float | str | None]:
     if is_short:
         entry = ema7 * 0.99
         stop_loss = ema7 * 1.015
-        target = _to_float_or_none(row.get("nearest_support"))
+        target = nearest_support
         rr_ratio = None
         if target is not None and stop_loss > entry and entry > target:
             rr_ratio = (entry - target) / (stop_loss - entry)
@@ -94,13 +113,77 @@ def signal_from_row(row: pd.Series) -> dict[str, float | str | None]:
     }
 
 
+def signal_from_row(row: pd.Series) -> dict[str, float | str | None]:
+    """Evaluate strategy rules on one candle row."""
+    return _signal_from_floats(*(_to_float_or_none(row.get(column)) for column in SIGNAL_INPUTS))
+
+
+def _finite_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Column as float64 with missing, NaN and infinite values all set to NaN."""
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.where(np.isfinite(values), values, np.nan)
+
+
 def build_signal_frame(df: pd.DataFrame) -> pd.DataFrame:
-    """Build action/entry/stop/target/rr columns for each row."""
+    """Build action/entry/stop/target/rr columns for each row.
+
+    Vectorized equivalent of applying ``signal_from_row`` to every row; NaN
+    plays the role of ``None``, so comparisons against it are simply false.
+    """
     if df.empty:
-        return pd.DataFrame(
-            columns=["action", "entry", "stop_loss", "target", "rr_ratio"], index=df.index
-        )
-    return df.apply(signal_from_row, axis=1, result_type="expand")
+        return pd.DataFrame(columns=SIGNAL_COLUMNS, index=df.index)
+
+    price = _finite_column(df, "price")
+    ema7 = _finite_column(df, "ema7")
+    macd_hist = _finite_column(df, "macd_hist")
+    macd_line = _finite_column(df, "macd_line")
+    rsi6 = _finite_column(df, "rsi6")
+    volume = _finite_column(df, "volume")
+    ma5_volume = _finite_column(df, "ma5_volume")
+
+    valid = ~np.isnan(price) & ~np.isnan(ema7) & (ema7 != 0)
+    near_ema_limit = ema7 * 1.01
+    is_long = (
+        valid
+        & (price > ema7)
+        & ((macd_hist > 0) | (macd_line > 0))
+        & (rsi6 < 70)
+        & (volume > ma5_volume)
+        & (price < near_ema_limit)
+    )
+    is_short = valid & (price < ema7) & ((macd_hist < 0) | (macd_line < 0)) & (rsi6 > 30)
+
+    entry = np.where(is_long, near_ema_limit, np.where(is_short, ema7 * 0.99, np.nan))
+    stop_loss = np.where(is_long, ema7 * 0.985, np.where(is_short, ema7 * 1.015, np.nan))
+    target = np.where(
+        is_long,
+        _finite_column(df, "nearest_resistance"),
+        np.where(is_short, _finite_column(df, "nearest_support"), np.nan),
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        long_rr = (target - entry) / (entry - stop_loss)
+        short_rr = (entry - target) / (stop_loss - entry)
+    rr_ratio = np.where(
+        is_long & (entry > stop_loss) & (target > entry),
+        long_rr,
+        np.where(is_short & (stop_loss > entry) & (entry > target), short_rr, np.nan),
+    )
+
+    action = np.where(is_long, "long", np.where(is_short, "short", "wait")).astype(object)
+    return pd.DataFrame(
+        {
+            "action": action,
+            "entry": entry,
+            "stop_loss": stop_loss,
+            "target": target,
+            "rr_ratio": rr_ratio,
+        },
+        index=df.index,
+        columns=SIGNAL_COLUMNS,
+    )
 
 
 def build_latest_signal(df: pd.DataFrame) -> dict[str, float | str | None]:
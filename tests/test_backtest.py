@@ -4,7 +4,44 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from cryptoinvest.backtest import load_ohlcv_csv, run_backtest, simulate_trades
+from cryptoinvest.backtest import (
+    build_backtest_frame,
+    fetch_ohlcv_ccxt,
+    load_ohlcv_csv,
+    load_prepared_csv,
+    run_backtest,
+    run_backtest_sweep,
+    simulate_trades,
+)
+
+_FOUR_HOURS_MS = 4 * 3600 * 1000
+
+
+class _FakeAsyncExchange:
+    """Serves a synthetic 4h candle stream; ``max_page`` caps each response."""
+
+    max_page = 1000
+
+    def __init__(self, config: dict) -> None:
+        self.calls: list[int] = []
+
+    def parse_timeframe(self, timeframe: str) -> int:
+        return 4 * 3600
+
+    async def fetch_ohlcv(self, symbol: str, timeframe: str, since: int, limit: int) -> list:
+        self.calls.append(since)
+        first = -(-since // _FOUR_HOURS_MS) * _FOUR_HOURS_MS
+        count = min(limit, self.max_page)
+        return [
+            [first + k * _FOUR_HOURS_MS, 100.0, 101.0, 99.0, 100.0, 10.0] for k in range(count)
+        ]
+
+    async def close(self) -> None:
+        pass
+
+
+class _CappedAsyncExchange(_FakeAsyncExchange):
+    max_page = 3
 
 
 def test_simulate_trades_metrics_are_deterministic() -> None:
@@ -32,6 +69,80 @@ def test_simulate_trades_metrics_are_deterministic() -> None:
     assert metrics["max_drawdown"] == pytest.approx(-0.05)
 
 
+def test_simulate_trades_decodes_trade_fields() -> None:
+    idx = pd.date_range("2025-01-01", periods=4, freq="4h", tz="UTC")
+    frame = pd.DataFrame(
+        {
+            "high": [101, 104, 112, 103],
+            "low": [99, 96, 100, 97],
+            "close": [100, 100, 101, 98],
+            "action": ["short", "wait", "long", "wait"],
+            "entry": [100.0, np.nan, 100.0, np.nan],
+            "stop_loss": [103.0, np.nan, 95.0, np.nan],
+            "target": [97.0, np.nan, 110.0, np.nan],
+        },
+        index=idx,
+    )
+
+    trades, _metrics = simulate_trades(frame)
+    assert list(trades["side"]) == ["short", "long"]
+    assert list(trades["exit_reason"]) == ["stop_and_target_same_candle", "end_of_data"]
+    assert list(trades["outcome"]) == ["loss", "loss"]
+    assert trades["signal_time"].tolist() == [idx[0], idx[2]]
+    assert trades["entry_time"].tolist() == [idx[1], idx[3]]
+    assert trades["exit_time"].tolist() == [idx[1], idx[3]]
+    assert trades["exit_price"].tolist() == pytest.approx([103.0, 98.0])
+
+
+def test_simulate_trades_eval_window_is_inclusive() -> None:
+    idx = pd.date_range("2025-01-01", periods=4, freq="4h", tz="UTC")
+    frame = pd.DataFrame(
+        {
+            "high": [101, 101, 102, 120],
+            "low": [99, 99, 98, 99],
+            "close": [100, 100, 101, 115],
+            "action": ["long", "long", "wait", "wait"],
+            "entry": [100.0, 100.0, np.nan, np.nan],
+            "stop_loss": [95.0, 95.0, np.nan, np.nan],
+            "target": [110.0, 110.0, np.nan, np.nan],
+        },
+        index=idx,
+    )
+
+    trades, _metrics = simulate_trades(
+        frame, eval_start="2025-01-01 04:00", eval_end="2025-01-01 08:00"
+    )
+    assert len(trades) == 1
+    assert trades["signal_time"].iloc[0] == idx[1]
+    assert trades["exit_time"].iloc[0] == idx[2]
+    assert trades["exit_reason"].iloc[0] == "end_of_data"
+
+
+@pytest.mark.parametrize("exchange_id", ["fakeexchange", "cappedexchange"])
+def test_fetch_ohlcv_ccxt_covers_range_concurrently(monkeypatch, exchange_id) -> None:
+    ccxt_async = pytest.importorskip("ccxt.async_support")
+    monkeypatch.setattr(ccxt_async, "fakeexchange", _FakeAsyncExchange, raising=False)
+    monkeypatch.setattr(ccxt_async, "cappedexchange", _CappedAsyncExchange, raising=False)
+
+    frame = fetch_ohlcv_ccxt(
+        exchange_id=exchange_id,
+        start="2025-01-01T00:00:00Z",
+        end="2025-01-05T23:59:59Z",
+        limit=7,
+        concurrency=2,
+    )
+    expected = pd.date_range("2025-01-01", "2025-01-05 20:00", freq="4h", tz="UTC")
+    assert frame.index.equals(expected)
+
+
+def test_fetch_ohlcv_ccxt_rejects_invalid_start(monkeypatch) -> None:
+    ccxt_async = pytest.importorskip("ccxt.async_support")
+    monkeypatch.setattr(ccxt_async, "fakeexchange", _FakeAsyncExchange, raising=False)
+
+    with pytest.raises(ValueError, match="Invalid ISO datetime"):
+        fetch_ohlcv_ccxt(exchange_id="fakeexchange", start="not-a-date")
+
+
 def test_load_ohlcv_csv_parses_timestamps(tmp_path) -> None:
     path = tmp_path / "ohlcv.csv"
     csv_data = """timestamp,open,high,low,close,volume
@@ -45,6 +156,94 @@ def test_load_ohlcv_csv_parses_timestamps(tmp_path) -> None:
     assert list(frame.columns) == ["open", "high", "low", "close", "volume"]
 
 
+def test_load_ohlcv_csv_sorts_and_dedupes(tmp_path) -> None:
+    path = tmp_path / "ohlcv.csv"
+    path.write_text(
+        """timestamp,open,high,low,close,volume
+2025-01-01T04:00:00Z,101,102,100,101,1100
+2025-01-01T00:00:00Z,100,101,99,100,1000
+2025-01-01T04:00:00Z,102,103,101,102,1200
+"""
+    )
+    frame = load_ohlcv_csv(path)
+    assert frame.index.is_monotonic_increasing
+    assert frame.index.is_unique
+    assert len(frame) == 2
+    assert frame["volume"].tolist() == [1000.0, 1200.0]
+
+
+@pytest.mark.parametrize(
+    "timestamps",
+    [
+        ("1735689600000", "1735704000000"),
+        ("2025-01-01T00:00:00Z", "2025-01-01T04:00:00Z"),
+    ],
+)
+def test_load_ohlcv_csv_fast_io_matches_pandas(tmp_path, timestamps) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "ohlcv.csv"
+    path.write_text(
+        f"""timestamp,open,high,low,close,volume
+{timestamps[0]},100,101,99,100,1000
+{timestamps[1]},101,102,100,101,1100
+"""
+    )
+    fast = load_ohlcv_csv(path, fast_io=True)
+    slow = load_ohlcv_csv(path)
+    pd.testing.assert_frame_equal(fast, slow)
+
+
+def test_load_prepared_csv_reuses_feather_cache(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "ohlcv.csv"
+    idx = pd.date_range("2025-01-01", periods=60, freq="4h", tz="UTC")
+    close = 100 + np.sin(np.arange(len(idx)) / 5.0) * 3
+    pd.DataFrame(
+        {
+            "timestamp": idx.view("int64") // 10**6,
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": 1000.0,
+        }
+    ).to_csv(path, index=False)
+    cache_dir = tmp_path / "cache"
+
+    fresh = load_prepared_csv(path, pivot_window=2, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.feather"))) == 1
+    cached = load_prepared_csv(path, pivot_window=2, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(cached, fresh)
+    pd.testing.assert_frame_equal(fresh, load_prepared_csv(path, pivot_window=2))
+
+    load_prepared_csv(path, pivot_window=3, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.feather"))) == 2
+
+
+def test_load_prepared_csv_cache_is_keyed_on_reader(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "ohlcv.csv"
+    idx = pd.date_range("2025-01-01", periods=60, freq="4h", tz="UTC")
+    close = 100 + np.sin(np.arange(len(idx)) / 5.0) * 3
+    pd.DataFrame(
+        {
+            "timestamp": idx.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": 1000.0,
+        }
+    ).to_csv(path, index=False)
+    cache_dir = tmp_path / "cache"
+
+    load_prepared_csv(path, pivot_window=2, cache_dir=cache_dir, fast_io=True)
+    cached = load_prepared_csv(path, pivot_window=2, cache_dir=cache_dir, fast_io=False)
+    pd.testing.assert_frame_equal(cached, load_prepared_csv(path, pivot_window=2))
+    assert len(list(cache_dir.glob("*.feather"))) == 2
+    assert not list(cache_dir.glob("*.tmp"))
+
+
 def test_run_backtest_from_csv_offline(tmp_path) -> None:
     path = tmp_path / "offline_ohlcv.csv"
     idx = pd.date_range("2025-01-01", periods=140, freq="4h", tz="UTC")
@@ -67,3 +266,31 @@ def test_run_backtest_from_csv_offline(tmp_path) -> None:
     )
     assert "action" in frame.columns
     assert isinstance(trades, pd.DataFrame)
+
+
+def test_run_backtest_sweep_matches_individual_runs() -> None:
+    idx = pd.date_range("2025-01-01", periods=300, freq="4h", tz="UTC")
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1.0, len(idx)))
+    raw = pd.DataFrame(
+        {
+            "open": close,
+            "high": close + rng.uniform(0.2, 2.0, len(idx)),
+            "low": close - rng.uniform(0.2, 2.0, len(idx)),
+            "close": close,
+            "volume": rng.uniform(500, 1500, len(idx)),
+        },
+        index=idx,
+    )
+
+    sweep = run_backtest_sweep(raw, pivot_windows=[2, 5], fee_rates=[0.0, 0.001])
+    assert list(sweep[["pivot_window", "fee_rate"]].itertuples(index=False, name=None)) == [
+        (2, 0.0),
+        (2, 0.001),
+        (5, 0.0),
+        (5, 0.001),
+    ]
+    for row in sweep.itertuples(index=False):
+        frame = build_backtest_frame(raw, pivot_window=row.pivot_window)
+        _trades, expected = simulate_trades(frame, fee_rate=row.fee_rate)
+        assert {key: getattr(row, key) for key in expected} == expected
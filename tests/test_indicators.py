@@ -13,6 +13,22 @@ def test_ema_known_values() -> None:
     assert np.allclose(result.to_numpy(), expected)
 
 
+def test_ema_and_rsi_match_pandas_ewm_with_gaps() -> None:
+    rng = np.random.default_rng(3)
+    close = pd.Series(100 + np.cumsum(rng.normal(0, 1, 200)))
+    close.iloc[[0, 17, 18, 90]] = np.nan
+
+    for period in (3, 7, 100):
+        expected = close.ewm(span=period, adjust=False).mean()
+        np.testing.assert_array_equal(ema(close, period).to_numpy(), expected.to_numpy())
+
+    delta = close.diff()
+    avg_gain = delta.clip(lower=0.0).ewm(alpha=1 / 6, adjust=False, min_periods=6).mean()
+    avg_loss = (-delta.clip(upper=0.0)).ewm(alpha=1 / 6, adjust=False, min_periods=6).mean()
+    expected_rsi = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+    np.testing.assert_allclose(rsi(close, period=6).to_numpy(), expected_rsi.to_numpy())
+
+
 def test_macd_hist_is_line_minus_signal() -> None:
     close = pd.Series(np.linspace(100, 120, 40), dtype=float)
     out = macd(close, fast=12, slow=26, signal=9)
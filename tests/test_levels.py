@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from cryptoinvest.levels import _nearest_levels_sorted, add_levels, detect_pivots
+
+
+def _reference_levels(df: pd.DataFrame, window: int) -> tuple[np.ndarray, np.ndarray]:
+    out = detect_pivots(df, window=window)
+    resistances: list[float] = []
+    supports: list[float] = []
+    res_col: list[float] = []
+    sup_col: list[float] = []
+    for ph, pl, price in zip(out["pivot_high"], out["pivot_low"], out["close"]):
+        if pd.notna(ph):
+            resistances.append(float(ph))
+        if pd.notna(pl):
+            supports.append(float(pl))
+        above = [r for r in resistances if r >= price]
+        below = [s for s in supports if s <= price]
+        res_col.append(min(above) if above else np.nan)
+        sup_col.append(max(below) if below else np.nan)
+    return np.array(res_col), np.array(sup_col)
+
+
+def _random_ohlc(n: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1.5, n))
+    return pd.DataFrame(
+        {
+            "high": close + rng.uniform(0.1, 2.0, n),
+            "low": close - rng.uniform(0.1, 2.0, n),
+            "close": close,
+        },
+        index=pd.date_range("2025-01-01", periods=n, freq="4h", tz="UTC"),
+    )
+
+
+def test_add_levels_matches_bruteforce_scan() -> None:
+    df = _random_ohlc(300)
+    for window in (2, 3, 5):
+        out = add_levels(df, window=window)
+        expected_res, expected_sup = _reference_levels(df, window)
+        np.testing.assert_array_equal(out["nearest_resistance"].to_numpy(), expected_res)
+        np.testing.assert_array_equal(out["nearest_support"].to_numpy(), expected_sup)
+
+
+def test_add_levels_known_values() -> None:
+    idx = pd.date_range("2025-01-01", periods=5, freq="4h", tz="UTC")
+    df = pd.DataFrame(
+        {
+            "high": [10.0, 12.0, 11.0, 13.0, 9.0],
+            "low": [8.0, 9.0, 7.0, 10.0, 6.0],
+            "close": [9.0, 11.0, 10.5, 11.5, 7.5],
+        },
+        index=idx,
+    )
+    out = add_levels(df, window=2)
+    np.testing.assert_array_equal(
+        out["nearest_resistance"].to_numpy(), [np.nan, 12.0, 12.0, 12.0, 12.0]
+    )
+    np.testing.assert_array_equal(out["nearest_support"].to_numpy(), [np.nan, np.nan, 7.0, 7.0, 7.0])
+
+
+def test_sorted_fallback_matches_bruteforce() -> None:
+    df = _random_ohlc(257, seed=11)
+    pivots = detect_pivots(df, window=3)
+    res, sup = _nearest_levels_sorted(
+        pivots["close"].to_numpy(dtype=np.float64),
+        pivots["pivot_high"].to_numpy(dtype=np.float64),
+        pivots["pivot_low"].to_numpy(dtype=np.float64),
+    )
+    expected_res, expected_sup = _reference_levels(df, 3)
+    np.testing.assert_array_equal(res, expected_res)
+    np.testing.assert_array_equal(sup, expected_sup)
+
+
+def test_detect_pivots_matches_pandas_rolling() -> None:
+    df = _random_ohlc(400, seed=11)
+    df["high"] = df["high"].round(0)
+    df["low"] = df["low"].round(0)
+    df.iloc[[5, 6, 50, 200], df.columns.get_loc("high")] = np.nan
+    df.iloc[[7, 120, 121, 399], df.columns.get_loc("low")] = np.nan
+    for window in (1, 2, 3, 7, 500):
+        out = detect_pivots(df, window=window)
+        rolling_high = df["high"].rolling(window, min_periods=window).max()
+        rolling_low = df["low"].rolling(window, min_periods=window).min()
+        np.testing.assert_array_equal(
+            out["pivot_high"].to_numpy(), df["high"].where(df["high"].eq(rolling_high))
+        )
+        np.testing.assert_array_equal(
+            out["pivot_low"].to_numpy(), df["low"].where(df["low"].eq(rolling_low))
+        )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from cryptoinvest.signals import build_latest_signal, signal_from_row
+from cryptoinvest.signals import build_latest_signal, build_signal_frame, signal_from_row
 
 
 def test_long_signal_rule_and_outputs() -> None:
@@ -98,3 +99,39 @@ def test_build_latest_signal_returns_last_row() -> None:
     )
     latest = build_latest_signal(df)
     assert latest["action"] == "short"
+
+
+def test_build_signal_frame_matches_row_rules() -> None:
+    rng = np.random.default_rng(3)
+    n = 500
+    ema7 = 100 + rng.normal(0, 1, n)
+    df = pd.DataFrame(
+        {
+            "price": ema7 * (1 + rng.normal(0, 0.01, n)),
+            "ema7": ema7,
+            "macd_hist": rng.normal(0, 1, n),
+            "macd_line": rng.normal(0, 1, n),
+            "rsi6": rng.uniform(0, 100, n),
+            "volume": rng.uniform(500, 1500, n),
+            "ma5_volume": rng.uniform(500, 1500, n),
+            "nearest_resistance": ema7 + rng.normal(2, 2, n),
+            "nearest_support": ema7 - rng.normal(2, 2, n),
+        }
+    )
+    df.loc[::7, "macd_hist"] = np.nan
+    df.loc[::11, "rsi6"] = np.inf
+    df.loc[::13, "nearest_resistance"] = np.nan
+    df.loc[::17, "nearest_support"] = np.nan
+    df.loc[::19, "ema7"] = 0.0
+    df.loc[::23, "price"] = np.nan
+
+    frame = build_signal_frame(df)
+    for i, (_, row) in enumerate(df.iterrows()):
+        expected = signal_from_row(row)
+        actual = frame.iloc[i]
+        assert actual["action"] == expected["action"]
+        for key in ("entry", "stop_loss", "target", "rr_ratio"):
+            if expected[key] is None:
+                assert np.isnan(actual[key])
+            else:
+                assert actual[key] == expected[key]